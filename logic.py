@@ -157,10 +157,59 @@ class ModelBackend:
             
             population = offspring
 
-        return best_solution
+        return best_solution, best_fitness
 
-    def run_task(self, inputs, targets):
-        """执行预测或反推任务"""
+    # ================= 🎯 局部精修 (Coordinate Line Search) =================
+    def _run_local_search(self, objective_func, bounds, x0, f0, max_evals=600, n_points=11, min_width=1e-3):
+        """
+        有界坐标线搜索，在 GA 精英解附近做无梯度精修
+        树模型的损失是分段常数，小步长试探容易卡在平台上，因此每轮沿每个坐标在窗口内
+        (含边界) 等距取点，移到最优点；一轮无改进则窗口减半，窗口收敛即提前结束
+        :param objective_func: 目标函数（损失函数）
+        :param bounds: 变量范围 [(min, max), ...]
+        :param x0: 起点 (通常为 GA 的最优解)
+        :param f0: 起点的损失值
+        :param max_evals: 最大评估次数
+        :param n_points: 每个坐标每轮的取点数
+        :param min_width: 最小窗口半宽 (占范围的比例)
+        """
+        lb = np.array([b[0] for b in bounds], dtype=float)
+        ub = np.array([b[1] for b in bounds], dtype=float)
+        span = ub - lb
+        # 跳过上下界相同的变量
+        active = [i for i in range(len(bounds)) if span[i] > 0]
+
+        best_x = np.clip(np.asarray(x0, dtype=float), lb, ub)
+        best_f = f0
+        evals = 0
+        width = 1.0  # 窗口半宽 (占范围的比例)，初始覆盖整个范围
+
+        while active and evals < max_evals and width >= min_width:
+            improved = False
+            for i in active:
+                lo = max(lb[i], best_x[i] - width * span[i])
+                hi = min(ub[i], best_x[i] + width * span[i])
+                for v in np.linspace(lo, hi, n_points):
+                    if evals >= max_evals: break
+                    if v == best_x[i]: continue
+                    x_try = best_x.copy()
+                    x_try[i] = v
+                    f_try = objective_func(x_try)
+                    evals += 1
+                    if f_try < best_f:
+                        best_f, best_x = f_try, x_try
+                        improved = True
+            # 一轮无改进则缩小窗口
+            if not improved:
+                width *= 0.5
+
+        return best_x, best_f
+
+    def run_task(self, inputs, targets, local_refine=False):
+        """
+        执行预测或反推任务
+        :param local_refine: 为 True 时采用混合策略：短程 GA 全局搜索 + 模式搜索局部精修
+        """
         try:
             # 1. 物理硬限位 (与训练代码保持一致)
             BASE_HARD_LIMITS = {
@@ -303,8 +352,12 @@ class ModelBackend:
 
             # --- 模式 B: 逆向优化 (Reverse / Optimization Mode) ---
             
+            # 记录模型评估次数
+            eval_counter = {'n': 0}
+
             # 定义目标函数 (Loss Function)
             def objective(x):
+                eval_counter['n'] += 1
                 current = fixed_params.copy()
                 # 将优化的变量值填入参数字典
                 for i, var in enumerate(optimize_vars):
@@ -331,24 +384,48 @@ class ModelBackend:
                 return loss
 
             best_vals = []
+            phases = []
             
             # 🔥 调用自定义遗传算法 🔥
             try:
-                best_vals = self._run_genetic_algorithm(
+                if local_refine:
+                    # 混合策略：缩短 GA (30 x 20 = 600 次评估)，剩余预算交给局部精修
+                    ga_cfg = {'pop_size': 30, 'generations': 20}
+                else:
+                    ga_cfg = {'pop_size': 50, 'generations': 40}
+                best_vals, best_loss = self._run_genetic_algorithm(
                     objective, 
                     optimize_bounds, 
-                    pop_size=50,       # 种群大小
-                    generations=40,    # 迭代次数
-                    mutation_rate=0.1  # 变异率
+                    mutation_rate=0.1,  # 变异率
+                    **ga_cfg
                 )
+                phases.append({'phase': 'GA', 'evaluations': eval_counter['n'], 'loss': float(best_loss)})
             except Exception as e:
                 # 兜底：如果GA运算出错，退化为随机搜索
                 print(f"Genetic Algorithm failed: {e}, using Random Search instead.")
+                local_refine = False
+                n_before = eval_counter['n']
                 best_score = float('inf')
                 for _ in range(500):
                     x_try = [random.uniform(b[0], b[1]) for b in optimize_bounds]
                     sc = objective(x_try)
                     if sc < best_score: best_score, best_vals = sc, x_try
+                phases.append({'phase': 'Random', 'evaluations': eval_counter['n'] - n_before, 'loss': float(best_score)})
+
+            # 🎯 局部精修：失败时保留 GA 结果
+            if local_refine:
+                n_before = eval_counter['n']
+                try:
+                    best_vals, best_loss = self._run_local_search(
+                        objective,
+                        optimize_bounds,
+                        best_vals,
+                        best_loss,
+                        max_evals=600
+                    )
+                    phases.append({'phase': 'Local', 'evaluations': eval_counter['n'] - n_before, 'loss': float(best_loss)})
+                except Exception as e:
+                    print(f"Local refinement failed: {e}, keeping GA result.")
 
             # 整理最终结果
             final_res_params = fixed_params.copy()
@@ -374,7 +451,8 @@ class ModelBackend:
                 'ads': final_pred[0], 
                 'rem': final_pred[1],
                 'optimized_params': {k: final_res_params[k] for k in optimize_vars},
-                'verification': verify
+                'verification': verify,
+                'optimization_report': {'phases': phases, 'total_evaluations': eval_counter['n']}
             }
 
         except Exception as e:
@@ -68,6 +68,8 @@ if 'pred_ads' not in st.session_state:
     st.session_state.pred_ads = 0.0
 if 'pred_rem' not in st.session_state:
     st.session_state.pred_rem = 0.0
+if 'opt_report' not in st.session_state:
+    st.session_state.opt_report = {}
 
 # ================= 3. 核心逻辑：单项确认判定 =================
 
@@ -127,6 +129,8 @@ with c_top2:
     with tc2:
         use_rem = st.checkbox("Rem. Rate (%)")
         target_rem = st.number_input("Tgt Rem", disabled=not use_rem, label_visibility="collapsed", key="tgt_rem")
+    # 混合优化：短程 GA + 局部精修，评估次数更少
+    use_refine = st.checkbox("GA + Local Refinement", key="use_refine")
 
 # --- Middle: 工艺参数 ---
 st.markdown("#### 2. Process Parameters")
@@ -245,13 +249,14 @@ if btn_run:
     }
     
     with st.spinner("Calculating..."):
-        res = st.session_state.backend.run_task(inputs, targets)
+        res = st.session_state.backend.run_task(inputs, targets, local_refine=use_refine)
     
     if res['success']:
         st.session_state.pred_ads = res['ads']
         st.session_state.pred_rem = res['rem']
         st.session_state.verify = res.get('verification', {})
         st.session_state.results = {}
+        st.session_state.opt_report = res.get('optimization_report', {})
         if res['mode'] == 'reverse':
             for k, v in res['optimized_params'].items():
                 st.session_state.results[k] = v
@@ -277,3 +282,9 @@ if 'pred_ads' in st.session_state:
             el_msg = v.get('elemental_msg', 'N/A')
             el_err = v.get('elemental_error', 0)
             r4.metric("Elem. Sum", el_msg, delta="✔" if el_err < 0.5 else "❌ Check", delta_color="inverse")
+
+            # 各阶段评估次数与损失
+            rep = st.session_state.opt_report
+            if rep:
+                phase_msg = " | ".join(f"{p['phase']}: {p['evaluations']} evals, loss {p['loss']:.4f}" for p in rep['phases'])
+                st.caption(f"Optimization — {phase_msg} | Total: {rep['total_evaluations']} evals")